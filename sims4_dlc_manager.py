@@ -1,6 +1,9 @@
 import os
 import sys
 import json
+import re
+import errno  # For telling cross-drive moves apart from other rename errors
+import stat  # For reading file types from a single os.stat() result
 import winreg  # Windows-specific registry access
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -9,6 +12,10 @@ import zipfile  # For zip operations
 import shutil  # For folder operations (e.g., renaming, copying)
 from datetime import datetime  # For timestamping backups
 import time # For formatting timestamps
+import functools  # For caching lookups that don't change during a session
+import threading  # For running long file operations off the GUI thread
+import queue  # For passing results from worker threads back to the GUI
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED  # For overlapping independent disk reads
 
 # --- Determine Base Directory ---
 if getattr(sys, 'frozen', False):
@@ -22,23 +29,45 @@ CONFIG_FILE = os.path.join(base_dir, "dlc_manager_config.json")   # File to stor
 DISABLED_SUFFIX = "_disabled"           # Suffix to disable DLC/mods by renaming
 SIMS4_STEAM_APPID = "1222670"          # Steam App ID for The Sims 4
 DLC_PREFIXES = ("EP", "GP", "SP", "FP", "KP")  # Prefixes identifying DLC folders
+_DLC_PREFIX_SET = frozenset(DLC_PREFIXES)  # All prefixes are two characters, so a slice lookup suffices
+_DISABLED_LEN = len(DISABLED_SUFFIX)
+_DISABLED_PKG = "_disabled.package"     # Disabled forms of mod files
+_DISABLED_PKG_LEN = len(_DISABLED_PKG)
+_DISABLED_SCRIPT = "_disabled.ts4script"
+_DISABLED_SCRIPT_LEN = len(_DISABLED_SCRIPT)
+_MOD_FILE_EXTENSIONS = (".package", ".ts4script")
+_MOD_TOGGLE = {".package": _DISABLED_PKG, ".ts4script": _DISABLED_SCRIPT}  # Enabled extension -> disabled suffix
+# Files that are already compressed (saves and packages are DBPF containers); deflating them again wastes CPU for almost no gain
+_STORED_EXTENSIONS = (".package", ".ts4script", ".save", ".zip", ".7z", ".rar", ".png", ".jpg")
+_VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')  # Library paths in Steam's libraryfolders.vdf
+_SAVE_SUFFIXES = (".save", ".SAVE", ".Save")  # The game writes ".save"; tuple avoids a lower() copy per file
+_SIZE_UNITS = ("Bytes", "KB", "MB", "GB", "TB")
+_DLC_ORDER = {"FP": 0, "EP": 1, "GP": 2, "SP": 3, "KP": 4}  # Display order of DLC types
 
 # --- Helper Functions ---
 
+_user_data_path = None # Cached by get_sims4_user_data_path() once found
+
 def get_sims4_user_data_path():
-    """Attempts to find the Sims 4 user data path (containing saves, mods, etc.)."""
+    """Attempts to find the Sims 4 user data path (containing saves, mods, etc.).
+    A found path is cached for the session (failed lookups are retried); call reset_user_data_cache() to look it up again."""
+    global _user_data_path
+    if _user_data_path:
+        return _user_data_path
     try:
         documents_path = os.path.join(os.path.expanduser("~"), "Documents")
         ea_path = os.path.join(documents_path, "Electronic Arts")
         sims4_user_path = os.path.join(ea_path, "The Sims 4")
         # Basic check - does 'The Sims 4' folder exist?
         if os.path.isdir(sims4_user_path):
+            _user_data_path = sims4_user_path
             return sims4_user_path
         else:
             # Check alternative location sometimes used by EA App/Origin
             alt_sims4_user_path = os.path.join(documents_path, "The Sims 4")
             if os.path.isdir(alt_sims4_user_path):
                 update_status("Using alternative user data path in Documents.")
+                _user_data_path = alt_sims4_user_path
                 return alt_sims4_user_path
             update_status("Could not reliably find Sims 4 user data path.")
             return None # Return None if neither common path exists
@@ -46,34 +75,79 @@ def get_sims4_user_data_path():
         update_status(f"Error finding user data path: {e}")
         return None
 
+_saves_path = None # Cached by get_saves_path()
+
+def get_saves_path():
+    """Returns the 'saves' folder inside the user data path ("" if that path is unknown).
+    Cached together with the user data path; an unknown path is looked up again next time."""
+    global _saves_path
+    if _saves_path is None:
+        sims4_user_path = get_sims4_user_data_path()
+        if not sims4_user_path:
+            return ""
+        _saves_path = os.path.join(sims4_user_path, "saves")
+    return _saves_path
+
+def reset_user_data_cache():
+    """Forgets the cached user data and saves paths (e.g., after the Documents folder was moved)."""
+    global _user_data_path, _saves_path
+    _user_data_path = None
+    _saves_path = None
+
 # --- Core Logic Functions ---
 
+# Parsed JSON is kept in memory and only re-read when the file's mtime changes
+_config_cache = None
+_config_mtime = None
+_dlc_mapping_cache = None
+_dlc_mapping_mtime = None
+_dlc_mapping_failed = False # Set once loading the DLC mapping has failed (error already shown)
+
 def load_config():
-    """Loads configuration from JSON file."""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            update_status(f"Warning: Error reading config: {e}")
+    """Loads configuration from JSON file (cached until the file changes)."""
+    global _config_cache, _config_mtime
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return {}
+    if _config_cache is not None and mtime == _config_mtime:
+        return dict(_config_cache) # Copy so callers can modify it freely
+    try:
+        with open(CONFIG_FILE, 'r') as f:
+            _config_cache = json.load(f)
+            _config_mtime = mtime
+            return dict(_config_cache)
+    except (json.JSONDecodeError, IOError) as e:
+        update_status(f"Warning: Error reading config: {e}")
     return {}
 
 def save_config(config):
     """Saves configuration to JSON file."""
+    global _config_cache, _config_mtime
     try:
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=4)
+        # Keep the cache in sync so the next load_config() doesn't hit the disk
+        _config_cache = dict(config)
+        _config_mtime = os.stat(CONFIG_FILE).st_mtime_ns
     except IOError as e:
         update_status(f"Error: Could not save config: {e}")
 
 def load_dlc_mapping():
-    """Loads DLC code-to-name mapping from JSON file."""
-    if not os.path.exists(DLC_MAPPING_FILE):
+    """Loads DLC code-to-name mapping from JSON file (cached until the file changes)."""
+    global _dlc_mapping_cache, _dlc_mapping_mtime
+    try:
+        mtime = os.stat(DLC_MAPPING_FILE).st_mtime_ns
+    except OSError:
         messagebox.showerror("Error", f"DLC mapping file '{DLC_MAPPING_FILE}' not found.\nPlace it in the script's directory.")
         return None
+    if _dlc_mapping_cache is not None and mtime == _dlc_mapping_mtime:
+        return _dlc_mapping_cache
     try:
         with open(DLC_MAPPING_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            _dlc_mapping_cache = json.load(f)
+            _dlc_mapping_mtime = mtime
+            return _dlc_mapping_cache
     except json.JSONDecodeError:
         messagebox.showerror("Error", f"Could not parse '{DLC_MAPPING_FILE}'.\nEnsure it's valid JSON.")
         return None
@@ -81,8 +155,19 @@ def load_dlc_mapping():
         messagebox.showerror("Error", f"Could not read '{DLC_MAPPING_FILE}'.\nError: {e}")
         return None
 
+def _iter_steam_library_paths(steam_path, library_folders_vdf):
+    """Yields the Steam folder, then each library path listed in libraryfolders.vdf line by line."""
+    yield steam_path
+    with open(library_folders_vdf, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = _VDF_PATH_RE.search(line)
+            if match:
+                yield match.group(1).replace('\\\\', '\\')
+
+@functools.lru_cache(maxsize=1)
 def find_steam_game_path(app_id):
-    """Tries to find the Steam game installation path via Windows Registry."""
+    """Tries to find the Steam game installation path via Windows Registry.
+    Falls back to libraryfolders.vdf only if no registry key exists. Cached per app_id."""
     try:
         potential_hives = [winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER]
         potential_views = [winreg.KEY_WOW64_32KEY, winreg.KEY_WOW64_64KEY]
@@ -96,9 +181,7 @@ def find_steam_game_path(app_id):
                             update_status(f"Found path via Registry: {install_location}")
                             return install_location
                 except FileNotFoundError:
-                    continue
-                except Exception as e:
-                    print(f"Registry access warning: {e}")
+                    continue # Key not in this hive/view; other errors are reported below
         # Fallback: Check common Steam library locations via libraryfolders.vdf
         steam_path_guesses = [
             os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"), "Steam"),
@@ -108,58 +191,58 @@ def find_steam_game_path(app_id):
             library_folders_vdf = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
             if os.path.exists(library_folders_vdf):
                 try:
-                    with open(library_folders_vdf, 'r') as f:
-                        content = f.read()
-                        import re
-                        paths = re.findall(r'"path"\s+"([^"]+)"', content)
-                        # Add the main steamapps folder as well
-                        possible_paths = [steam_path] + [p.replace('\\\\', '\\') for p in paths]
-                        for lib_path in possible_paths:
-                            game_path_guess = os.path.join(lib_path, "steamapps", "common", "The Sims 4")
-                            if os.path.isdir(game_path_guess):
-                                update_status(f"Found path via libraryfolders.vdf: {game_path_guess}")
-                                return game_path_guess
+                    # Check the main steamapps folder first, then each library as it is read
+                    for lib_path in _iter_steam_library_paths(steam_path, library_folders_vdf):
+                        game_path_guess = os.path.join(lib_path, "steamapps", "common", "The Sims 4")
+                        if os.path.isdir(game_path_guess):
+                            update_status(f"Found path via libraryfolders.vdf: {game_path_guess}")
+                            return game_path_guess
                 except Exception as e:
                     print(f"Could not read/parse libraryfolders.vdf: {e}")
     except Exception as e:
         update_status(f"Registry/Auto-detect error: {e}")
     return None
 
+def _is_empty_dir(path):
+    """Returns True if the directory has no entries."""
+    with os.scandir(path) as it:
+        return next(it, None) is None
+
 def scan_dlc(game_path):
     """Scans the game directory for DLC folders and determines their status."""
     if not game_path or not os.path.isdir(game_path):
         update_status("Cannot scan: Invalid game path.")
         return []
-    dlc_list = []
-    update_status("Scanning DLC folders...")
-    root.update_idletasks() # Ensure UI updates
+    candidates = [] # (full_path, dlc_info) for folders that look like DLCs
+    update_status_throttled("Scanning DLC folders...")
     try:
-        for item in os.listdir(game_path):
-            full_path = os.path.join(game_path, item)
-            if os.path.isdir(full_path):
-                folder_name = item
+        # scandir reuses the file type info from the directory listing (no extra stat per item)
+        with os.scandir(game_path) as it:
+            for entry in it:
+                folder_name = entry.name
                 status = "Enabled"
                 original_name = folder_name
                 if folder_name.endswith(DISABLED_SUFFIX):
-                    original_name = folder_name[:-len(DISABLED_SUFFIX)]
+                    original_name = folder_name[:-_DISABLED_LEN]
                     status = "Disabled"
-                # Check if it looks like a DLC folder
-                if any(original_name.startswith(prefix) for prefix in DLC_PREFIXES):
-                    # Basic check if folder seems non-empty (avoids listing empty placeholders)
-                    is_empty = not any(os.scandir(full_path))
-                    if not is_empty:
-                        dlc_list.append({
-                            "folder": folder_name,
-                            "original_name": original_name,
-                            "status": status
-                        })
+                # Reject names that can't be DLCs before any type lookup or disk access
+                if original_name[:2] not in _DLC_PREFIX_SET:
+                    continue
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                candidates.append((entry.path, {
+                    "folder": folder_name,
+                    "original_name": original_name,
+                    "status": status
+                }))
+                update_status_throttled(f"Scanning DLC folders... {len(candidates)} found")
+        # Basic check if folders seem non-empty (avoids listing empty placeholders).
+        # The probes are independent, so overlap their directory reads.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            empties = list(executor.map(_is_empty_dir, [full_path for full_path, _ in candidates]))
+        dlc_list = [dlc for (_, dlc), is_empty in zip(candidates, empties) if not is_empty]
         # Sort DLCs: FP, EP, GP, SP, KP, then alphabetically
-        dlc_list.sort(key=lambda x: (x["original_name"].startswith('FP'),
-                                     x["original_name"].startswith('EP'),
-                                     x["original_name"].startswith('GP'),
-                                     x["original_name"].startswith('SP'),
-                                     x["original_name"].startswith('KP'),
-                                     x["original_name"]))
+        dlc_list.sort(key=lambda x: (_DLC_ORDER.get(x["original_name"][:2], 9), x["original_name"]))
         update_status(f"Scan complete. Found {len(dlc_list)} DLC items.")
         return dlc_list
     except FileNotFoundError:
@@ -208,50 +291,50 @@ def scan_mods(mods_path):
         return []
 
     mods_list = []
-    update_status("Scanning Mods folder...")
-    root.update_idletasks()
+    update_status_throttled("Scanning Mods folder...")
     try:
         # List only top-level items for management
-        for item in os.listdir(mods_path):
-            full_path = os.path.join(mods_path, item)
-            # Ignore the Resource.cfg file
-            if item.lower() == 'resource.cfg':
-                continue
-
-            if os.path.isfile(full_path) and (item.lower().endswith(".package") or item.lower().endswith(".ts4script")):
-                disabled_package_suffix = "_disabled.package"
-                disabled_script_suffix = "_disabled.ts4script"
-                status = "Enabled"
-                original_name = item
-
-                if item.lower().endswith(disabled_package_suffix):
-                    original_name = item[:-len(disabled_package_suffix)] + ".package"
-                    status = "Disabled"
-                elif item.lower().endswith(disabled_script_suffix):
-                    original_name = item[:-len(disabled_script_suffix)] + ".ts4script"
-                    status = "Disabled"
-
-                mods_list.append({
-                    "type": "file",
-                    "name": item,
-                    "original_name": original_name,
-                    "status": status,
-                    "path": full_path
-                })
-            elif os.path.isdir(full_path):
-                status = "Enabled"
-                original_name = item
-                if item.endswith(DISABLED_SUFFIX):
-                    original_name = item[:-len(DISABLED_SUFFIX)]
-                    status = "Disabled"
+        with os.scandir(mods_path) as it:
+            for entry in it:
+                item = entry.name
+                lower_name = item.lower()
+                # Ignore the Resource.cfg file
+                if lower_name == 'resource.cfg':
+                    continue
 
-                mods_list.append({
-                    "type": "folder",
-                    "name": item,
-                    "original_name": original_name,
-                    "status": status,
-                    "path": full_path
-                })
+                if entry.is_file() and lower_name.endswith(_MOD_FILE_EXTENSIONS):
+                    status = "Enabled"
+                    original_name = item
+
+                    if lower_name.endswith(_DISABLED_PKG):
+                        original_name = item[:-_DISABLED_PKG_LEN] + ".package"
+                        status = "Disabled"
+                    elif lower_name.endswith(_DISABLED_SCRIPT):
+                        original_name = item[:-_DISABLED_SCRIPT_LEN] + ".ts4script"
+                        status = "Disabled"
+
+                    mods_list.append({
+                        "type": "file",
+                        "name": item,
+                        "original_name": original_name,
+                        "status": status,
+                        "path": entry.path
+                    })
+                elif entry.is_dir():
+                    status = "Enabled"
+                    original_name = item
+                    if item.endswith(DISABLED_SUFFIX):
+                        original_name = item[:-_DISABLED_LEN]
+                        status = "Disabled"
+
+                    mods_list.append({
+                        "type": "folder",
+                        "name": item,
+                        "original_name": original_name,
+                        "status": status,
+                        "path": entry.path
+                    })
+                update_status_throttled(f"Scanning Mods folder... {len(mods_list)} found")
         mods_list.sort(key=lambda x: x["name"].lower())
         update_status(f"Mods scan complete. Found {len(mods_list)} top-level items.")
         return mods_list
@@ -266,10 +349,10 @@ def toggle_mod_status_backend(mod_info):
 
     if mod_info["type"] == "file":
         if mod_info["status"] == "Enabled":
-            if mod_info["original_name"].lower().endswith(".package"):
-                target_name = mod_info["original_name"][:-len(".package")] + "_disabled.package"
-            elif mod_info["original_name"].lower().endswith(".ts4script"):
-                target_name = mod_info["original_name"][:-len(".ts4script")] + "_disabled.ts4script"
+            stem, ext = os.path.splitext(mod_info["original_name"])
+            disabled_suffix = _MOD_TOGGLE.get(ext.lower())
+            if disabled_suffix:
+                target_name = stem + disabled_suffix
             else: # Should not happen based on scan, but safety check
                 target_name = mod_info["original_name"] + DISABLED_SUFFIX
         else: # Currently disabled, enable it
@@ -306,9 +389,54 @@ def toggle_mod_status_backend(mod_info):
         messagebox.showerror("Error", f"Failed to rename.\nError: {e}")
         return False
 
+_WINDOWS_ILLEGAL_CHARS = str.maketrans(':<>|"?*', '_______') # Replaced the same way ZipFile.extract() does
+
+def _safe_member_path(filename):
+    """Turns a zip member name into a relative path that is safe to create, as ZipFile.extract() does:
+    drive letters, '.'/'..' and empty parts are dropped and, on Windows, illegal characters become '_'
+    and trailing dots/spaces are stripped. Returns "" if nothing usable is left."""
+    arcname = filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+    if os.path.sep == '\\':
+        parts = [part.translate(_WINDOWS_ILLEGAL_CHARS).rstrip('. ') for part in parts]
+        parts = [part for part in parts if part]
+    return os.path.sep.join(parts)
+
+def _iter_relative_entries(folder, base_len=None):
+    """Recursively yields (relative_path, is_linked_dir) for every file and sub-folder under folder.
+    Symlinked folders are yielded but not descended into (they may loop back); check paths below them on disk."""
+    if base_len is None:
+        base_len = len(folder) + 1
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry.path[base_len:], False
+                yield from _iter_relative_entries(entry.path, base_len)
+            else:
+                yield entry.path[base_len:], entry.is_dir() # True only for a symlink to a folder
+
+def _fast_copy(src, dst):
+    """Copies a file with the Windows copy routine (CopyFileW), preserving metadata like shutil.copy2.
+    shutil.copy2 itself only uses the OS copy (CopyFile2) from Python 3.12 on; before that it copies
+    through a buffer. Never overwrites dst; falls back to shutil.copy2 if CopyFileW fails for any other reason."""
+    try:
+        # bFailIfExists=True: never overwrite an existing mod
+        if not ctypes.windll.kernel32.CopyFileW(ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), True):
+            raise ctypes.WinError()
+        shutil.copystat(src, dst)
+    except FileExistsError:
+        raise
+    except OSError:
+        shutil.copy2(src, dst) # copy2 preserves metadata
+
 # --- NEW: Install Mod Function ---
 def install_new_mod():
     """Installs a new mod from a zip or package file without overwriting."""
+    if file_job_running():
+        return
     sims4_user_path = get_sims4_user_data_path()
     if not sims4_user_path:
         messagebox.showerror("Error", "Could not determine Sims 4 user data directory.")
@@ -332,87 +460,221 @@ def install_new_mod():
         return
 
     filename = os.path.basename(mod_file_path)
-    skipped_files = []
-    installed_count = 0
 
-    update_status(f"Installing '{filename}'...")
-    root.update_idletasks()
+    update_status(f"Installing '{filename}'...") # Shown once control returns to the event loop
 
-    try:
-        if mod_file_path.lower().endswith(".zip"):
-            if not zipfile.is_zipfile(mod_file_path):
-                messagebox.showerror("Error", f"'{filename}' is not a valid ZIP file.")
-                update_status("Installation failed: Invalid ZIP.")
-                return
+    def _install(post):
+        """Runs on a worker thread; UI calls are handed to the Tk thread via post()."""
+        skipped_files = []
+        installed_count = 0
 
-            with zipfile.ZipFile(mod_file_path, 'r') as zipf:
-                members = zipf.infolist()
-                for member in members:
-                    target_path = os.path.join(mods_path, member.filename)
-
-                    # Prevent path traversal exploits (though zipfile usually handles this)
-                    if not os.path.abspath(target_path).startswith(os.path.abspath(mods_path)):
-                        update_status(f"Skipping potentially unsafe path: {member.filename}")
-                        skipped_files.append(f"{member.filename} (unsafe path)")
-                        continue
-
-                    # Check for existence before extraction
-                    if os.path.exists(target_path):
-                        skipped_files.append(member.filename)
-                        continue # Skip extraction
-
-                    # Extract if it doesn't exist
-                    zipf.extract(member, mods_path)
+        try:
+            if mod_file_path.lower().endswith(".zip"):
+                if not zipfile.is_zipfile(mod_file_path):
+                    post(messagebox.showerror, "Error", f"'{filename}' is not a valid ZIP file.")
+                    post(update_status, "Installation failed: Invalid ZIP.")
+                    return
+
+                # Collect what's already in Mods once, instead of a stat per zip member
+                existing = set()
+                linked_dirs = set()
+                for rel_path, is_linked_dir in _iter_relative_entries(mods_path):
+                    existing.add(os.path.normcase(rel_path))
+                    if is_linked_dir:
+                        linked_dirs.add(os.path.normcase(rel_path))
+
+                def _already_exists(key, target_path):
+                    """Looks key up in the index; paths inside a symlinked folder are checked on disk."""
+                    if key in existing:
+                        return True
+                    if linked_dirs:
+                        parent = os.path.dirname(key)
+                        while parent:
+                            if parent in linked_dirs:
+                                return os.path.exists(target_path)
+                            parent = os.path.dirname(parent)
+                    return False
+
+                with zipfile.ZipFile(mod_file_path, 'r') as zipf:
+                    members = zipf.infolist()
+                    for member in members:
+                        # Sanitize the name like zipf.extract() would (drive letters, '..', illegal characters)
+                        rel_path = _safe_member_path(member.filename)
+                        target_path = os.path.join(mods_path, rel_path)
+
+                        # Prevent path traversal exploits
+                        if not rel_path or not os.path.abspath(target_path).startswith(os.path.abspath(mods_path)):
+                            post(update_status, f"Skipping potentially unsafe path: {member.filename}")
+                            skipped_files.append(f"{member.filename} (unsafe path)")
+                            continue
+
+                        # Check for existence before extraction (normcase: case-insensitive on Windows)
+                        key = os.path.normcase(rel_path)
+                        if _already_exists(key, target_path):
+                            skipped_files.append(member.filename)
+                            continue # Skip extraction
+
+                        # Extract if it doesn't exist, streaming with a 1 MiB buffer
+                        if member.is_dir():
+                            os.makedirs(target_path, exist_ok=True)
+                        else:
+                            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                            with zipf.open(member) as src, open(target_path, 'wb') as dst:
+                                shutil.copyfileobj(src, dst, length=1024 * 1024)
+                        installed_count += 1
+                        # Record it (and any folders makedirs created) so a duplicate member isn't written over it
+                        while key and key not in existing:
+                            existing.add(key)
+                            key = os.path.dirname(key)
+
+            elif mod_file_path.lower().endswith((".package", ".ts4script")):
+                target_path = os.path.join(mods_path, filename)
+                if os.path.exists(target_path):
+                    skipped_files.append(filename)
+                else:
+                    _fast_copy(mod_file_path, target_path)
                     installed_count += 1
-
-        elif mod_file_path.lower().endswith((".package", ".ts4script")):
-            target_path = os.path.join(mods_path, filename)
-            if os.path.exists(target_path):
-                skipped_files.append(filename)
             else:
-                shutil.copy2(mod_file_path, target_path) # copy2 preserves metadata
-                installed_count += 1
-        else:
-            messagebox.showwarning("Unsupported File", f"Don't know how to install '{filename}'. Only .zip, .package, and .ts4script supported.")
-            update_status("Installation failed: Unsupported file type.")
-            return
+                post(messagebox.showwarning, "Unsupported File", f"Don't know how to install '{filename}'. Only .zip, .package, and .ts4script supported.")
+                post(update_status, "Installation failed: Unsupported file type.")
+                return
 
-        # --- Report results ---
-        if installed_count > 0 and not skipped_files:
-            update_status(f"Successfully installed '{filename}'.")
-            messagebox.showinfo("Install Complete", f"Mod '{filename}' installed successfully.")
-        elif installed_count > 0 and skipped_files:
-            update_status(f"Installed '{filename}' with skips.")
-            messagebox.showwarning("Install Partially Complete",
-                                   f"Mod '{filename}' installed, but the following items already existed and were SKIPPED:\n\n" + "\n".join(skipped_files))
-        elif installed_count == 0 and skipped_files:
-             update_status(f"Installation skipped: '{filename}' contents already exist.")
-             messagebox.showinfo("Install Skipped",
-                                 f"Installation of '{filename}' skipped. All contained files/folders already exist in the Mods directory.")
-        else: # installed_count == 0 and not skipped_files (e.g., empty zip?)
-             update_status(f"No new files installed from '{filename}'.")
-             messagebox.showinfo("Install Complete", f"No new files were installed from '{filename}'. It might be empty or contain only existing items.")
-
-        refresh_mods_list() # Update the mod list view
-
-    except zipfile.BadZipFile:
-         messagebox.showerror("Error", f"'{filename}' is corrupted or not a valid ZIP file.")
-         update_status("Installation failed: Bad ZIP file.")
-    except PermissionError:
-        messagebox.showerror("Permission Error", f"Permission denied during installation.\nCheck permissions for:\n{mods_path}")
-        update_status("Installation failed: Permission denied.")
-    except Exception as e:
-        update_status(f"Installation failed: {e}")
-        messagebox.showerror("Installation Error", f"Could not install mod '{filename}'.\nError: {e}")
+            # --- Report results ---
+            if installed_count > 0 and not skipped_files:
+                post(update_status, f"Successfully installed '{filename}'.")
+                post(messagebox.showinfo, "Install Complete", f"Mod '{filename}' installed successfully.")
+            elif installed_count > 0 and skipped_files:
+                post(update_status, f"Installed '{filename}' with skips.")
+                post(messagebox.showwarning, "Install Partially Complete",
+                     f"Mod '{filename}' installed, but the following items already existed and were SKIPPED:\n\n" + "\n".join(skipped_files))
+            elif installed_count == 0 and skipped_files:
+                 post(update_status, f"Installation skipped: '{filename}' contents already exist.")
+                 post(messagebox.showinfo, "Install Skipped",
+                      f"Installation of '{filename}' skipped. All contained files/folders already exist in the Mods directory.")
+            else: # installed_count == 0 and not skipped_files (e.g., empty zip?)
+                 post(update_status, f"No new files installed from '{filename}'.")
+                 post(messagebox.showinfo, "Install Complete", f"No new files were installed from '{filename}'. It might be empty or contain only existing items.")
+
+            post(refresh_mods_list) # Update the mod list view
+
+        except zipfile.BadZipFile:
+             post(messagebox.showerror, "Error", f"'{filename}' is corrupted or not a valid ZIP file.")
+             post(update_status, "Installation failed: Bad ZIP file.")
+        except PermissionError:
+            post(messagebox.showerror, "Permission Error", f"Permission denied during installation.\nCheck permissions for:\n{mods_path}")
+            post(update_status, "Installation failed: Permission denied.")
+        except Exception as e:
+            post(update_status, f"Installation failed: {e}")
+            post(messagebox.showerror, "Installation Error", f"Could not install mod '{filename}'.\nError: {e}")
+
+    run_in_background(_install, file_job=True)
 
 
 # --- GUI Functions ---
 
+_last_status = [""] # Message currently shown in the status bar
+
 def update_status(message):
-    """Updates the status bar with a message."""
+    """Updates the status bar with a message (skipped if it's already showing)."""
+    if message == _last_status[0]:
+        return
+    _last_status[0] = message
     status_var.set(message)
     # print(message) # Optional: print to console for debugging
 
+_last_status_update = [0.0] # time.monotonic() of the last forced redraw
+
+def update_status_throttled(message, min_interval=0.1):
+    """Updates the status bar from inside long loops, redrawing the UI at most ~10 times per second."""
+    update_status(message)
+    now = time.monotonic()
+    if now - _last_status_update[0] > min_interval:
+        root.update_idletasks()
+        _last_status_update[0] = now
+
+_file_job = [False] # True while a backup/restore/install is writing files
+
+def file_job_running():
+    """Returns True (and says so in the status bar) while a backup/restore/install is still running."""
+    if _file_job[0]:
+        update_status("Please wait for the current backup/restore/install to finish.")
+    return _file_job[0]
+
+def set_file_buttons_state(buttons, enabled):
+    """Enables/disables backup, restore and install buttons; they stay disabled while a file job runs."""
+    state = tk.NORMAL if enabled and not _file_job[0] else tk.DISABLED
+    for button in buttons:
+        button.config(state=state)
+
+def reset_file_buttons():
+    """Sets every backup/restore/install button according to whether its folder exists."""
+    saves_path = get_saves_path()
+    set_file_buttons_state((backup_saves_button, restore_saves_button), bool(saves_path) and os.path.isdir(saves_path))
+    if "mods" in _built_tabs:
+        sims4_user_path = get_sims4_user_data_path()
+        mods_found = bool(sims4_user_path) and os.path.isdir(os.path.join(sims4_user_path, "Mods"))
+        set_file_buttons_state((backup_mods_button, restore_mods_button, install_mod_button), mods_found)
+
+def run_in_background(work, buttons=(), file_job=False):
+    """Runs work(post) on a daemon thread so long file operations don't freeze the window.
+    The worker must not touch Tk directly: post(func, *args) queues func(*args) to run on the
+    Tk thread, which drains the queue every 100 ms. The given buttons are disabled meanwhile.
+    With file_job=True only one such job runs at a time and all backup/restore/install buttons
+    stay disabled until it finishes (closing the window asks for confirmation meanwhile)."""
+    if file_job:
+        if file_job_running():
+            return
+        _file_job[0] = True
+        reset_file_buttons()
+    task_queue = queue.Queue()
+    for button in buttons:
+        button.config(state=tk.DISABLED)
+
+    def _worker():
+        try:
+            work(lambda func, *args: task_queue.put((func, args)))
+        except Exception as e:
+            task_queue.put((update_status, (f"Error: {e}",)))
+        finally:
+            task_queue.put((None, ())) # Marks the end of the task
+
+    def _drain_queue():
+        pending_status = None # Only the latest of consecutive status messages is shown
+        finished = False
+        try:
+            while True:
+                try:
+                    func, args = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if func is update_status:
+                    pending_status = args
+                    continue
+                if pending_status is not None:
+                    update_status(*pending_status)
+                    pending_status = None
+                if func is None:
+                    finished = True
+                    if file_job:
+                        _file_job[0] = False
+                    for button in buttons:
+                        button.config(state=tk.NORMAL)
+                    if file_job:
+                        reset_file_buttons()
+                    return
+                try:
+                    func(*args)
+                except Exception as e:
+                    update_status(f"Error: {e}") # Keep draining so the end marker is always reached
+            if pending_status is not None:
+                update_status(*pending_status)
+        finally:
+            if not finished:
+                root.after(100, _drain_queue)
+
+    threading.Thread(target=_worker, daemon=True).start()
+    root.after(100, _drain_queue)
+
 def browse_game_path():
     """Opens a dialog to select the game installation path."""
     initial_dir = os.path.dirname(game_path_var.get()) if game_path_var.get() and os.path.isdir(os.path.dirname(game_path_var.get())) else "C:\\"
@@ -431,9 +693,26 @@ def browse_game_path():
         save_config(config)
         update_status(f"Game path set to: {new_path}")
         refresh_dlc_list() # Refresh DLC list since path changed
+        reset_user_data_cache() # Re-detect the user data folder and show what's there now
+        refresh_mods_list()
+        update_save_info()
     elif new_path: # User selected something, but it wasn't a valid directory after selection
         messagebox.showwarning("Invalid Path", "The selected path is not a valid directory.")
 
+def get_dlc_mapping():
+    """Returns the DLC code-to-name mapping, loaded when first needed.
+    load_dlc_mapping() keeps the only cache, so edits to the file are picked up. A failed load is
+    remembered for the session, so its error isn't shown again on every refresh or toggle."""
+    global _dlc_mapping_failed
+    if _dlc_mapping_failed:
+        return {}
+    mapping = load_dlc_mapping()
+    if mapping is None:
+        # Error message shown in load_dlc_mapping; fall back to "Unknown" names
+        _dlc_mapping_failed = True
+        return {}
+    return mapping
+
 def populate_dlc_listbox():
     """Populates the DLC listbox with current DLC status."""
     dlc_listbox.delete(0, tk.END)
@@ -454,29 +733,26 @@ def populate_dlc_listbox():
         dlc_listbox.insert(tk.END, " No DLCs found (or path inaccessible/permission error).")
         dlc_listbox.itemconfig(0, {"fg": "grey"})
     else:
-        # Determine padding based on longest code and name for alignment
-        max_code = 0
-        max_name = 0
-        for dlc in dlcs:
-             max_code = max(max_code, len(dlc['original_name']))
-             name = dlc_mapping.get(dlc['original_name'], f"Unknown ({dlc['original_name']})")
-             max_name = max(max_name, len(name))
-
-        for i, dlc in enumerate(dlcs):
-            status = dlc["status"]
-            code = dlc['original_name']
-            name = dlc_mapping.get(code, f"Unknown ({code})")
-            # Use f-string formatting for alignment
-            display_text = f"[{status:<8}] {code:<{max_code+2}} {name}"
-            dlc_listbox.insert(tk.END, display_text)
+        dlc_mapping = get_dlc_mapping()
+        # Resolve names once: (status, code, name) per DLC
+        rendered = [(d["status"], d["original_name"], dlc_mapping.get(d["original_name"], f"Unknown ({d['original_name']})"))
+                    for d in dlcs]
+        # Determine padding based on longest code for alignment
+        max_code = max(len(code) for _, code, _ in rendered)
+
+        # Use f-string formatting for alignment; insert all rows in one Tk call
+        dlc_listbox.insert(tk.END, *[f"[{status:<8}] {code:<{max_code+2}} {name}" for status, code, name in rendered])
+        for i, (status, _, _) in enumerate(rendered):
             dlc_listbox.itemconfig(i, {"fg": "darkgreen" if status == "Enabled" else "darkred"})
+        dlc_listbox.update_idletasks() # Redraw once after all rows are configured
 
     # Update button state after population
     on_dlc_select(None) # Pass None as event isn't needed here
 
 def refresh_dlc_list():
-    """Refreshes the DLC listbox."""
-    populate_dlc_listbox()
+    """Refreshes the DLC listbox (if the DLC tab has been built yet)."""
+    if "dlc" in _built_tabs:
+        populate_dlc_listbox()
 
 def on_dlc_select(event):
     """Enables the toggle button when a DLC is selected."""
@@ -529,15 +805,11 @@ def populate_mods_listbox():
         mods_listbox.itemconfig(0, {"fg": "grey"})
         toggle_mod_button.config(state=tk.DISABLED)
         # Disable backup/restore/install if path invalid
-        backup_mods_button.config(state=tk.DISABLED)
-        restore_mods_button.config(state=tk.DISABLED)
-        install_mod_button.config(state=tk.DISABLED) # NEW
+        set_file_buttons_state((backup_mods_button, restore_mods_button, install_mod_button), False)
         return
 
-    # Path exists, enable buttons dependent on it
-    backup_mods_button.config(state=tk.NORMAL)
-    restore_mods_button.config(state=tk.NORMAL)
-    install_mod_button.config(state=tk.NORMAL) # NEW
+    # Path exists, enable buttons dependent on it (unless a backup/restore/install is running)
+    set_file_buttons_state((backup_mods_button, restore_mods_button, install_mod_button), True)
 
     mods = scan_mods(mods_path) # Status updated inside scan_mods
     current_mod_list.extend(mods)
@@ -546,27 +818,25 @@ def populate_mods_listbox():
         mods_listbox.insert(tk.END, " No mods found (or only Resource.cfg).")
         mods_listbox.itemconfig(0, {"fg": "grey"})
     else:
-        # Determine padding
-        max_name = 0
+        display_list = []
         for mod in mods:
-            max_name = max(max_name, len(mod["name"]))
-
-        for i, mod in enumerate(mods):
-            status = mod["status"]
-            name = mod["name"]
             type_indicator = "[F]" if mod["type"] == "folder" else "[P]" # P for package/script
             # Format for alignment
-            display_text = f"{type_indicator} [{status:<8}] {name}"
-            mods_listbox.insert(tk.END, display_text)
-            color = "darkgreen" if status == "Enabled" else "darkred"
+            display_list.append(f"{type_indicator} [{mod['status']:<8}] {mod['name']}")
+        # Insert all rows in one Tk call, then colour them
+        mods_listbox.insert(tk.END, *display_list)
+        for i, mod in enumerate(mods):
+            color = "darkgreen" if mod["status"] == "Enabled" else "darkred"
             mods_listbox.itemconfig(i, {"fg": color})
+        mods_listbox.update_idletasks() # Redraw once after all rows are configured
 
     # Update toggle button state
     on_mod_select(None)
 
 def refresh_mods_list():
-    """Refreshes the mods listbox."""
-    populate_mods_listbox()
+    """Refreshes the mods listbox (if the Mods tab has been built yet)."""
+    if "mods" in _built_tabs:
+        populate_mods_listbox()
 
 def on_mod_select(event):
     """Enables the toggle button when a mod is selected."""
@@ -574,6 +844,8 @@ def on_mod_select(event):
 
 def toggle_selected_mod():
     """Toggles the status of the selected mod."""
+    if file_job_running(): # Don't rename files a restore/install may be writing
+        return
     selected_indices = mods_listbox.curselection()
     if not selected_indices:
         update_status("No mod selected.")
@@ -603,8 +875,109 @@ def toggle_selected_mod():
 
 # --- Save/Restore Functions (Shared logic for backup/restore messages) ---
 
+def _iter_backup_files(folder, skip_prefix, base_len=None):
+    """Recursively yields (full_path, arcname) for every file under folder.
+    Sub-folders whose name starts with skip_prefix are not descended into."""
+    if base_len is None:
+        base_len = len(folder) + 1 # arcname is the path relative to the top folder
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(skip_prefix):
+                    yield from _iter_backup_files(entry.path, skip_prefix, base_len)
+            elif entry.is_file():
+                yield entry.path, entry.path[base_len:]
+
+def _write_to_zip(zipf, full_path, arcname, buffer):
+    """Streams one file into the archive, storing already-compressed formats as-is
+    and deflating everything else at the fastest level. buffer is a writable memoryview
+    reused across stored files so a backup of thousands of files doesn't allocate one per file."""
+    if not full_path.lower().endswith(_STORED_EXTENSIONS):
+        # Small misc files: ZipFile.write() is the public way to pick a compression level
+        zipf.write(full_path, arcname, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+        return
+    info = zipfile.ZipInfo.from_file(full_path, arcname)
+    info.compress_type = zipfile.ZIP_STORED
+    # Unbuffered reads go straight into the shared buffer (no intermediate copy)
+    with open(full_path, 'rb', buffering=0) as src, zipf.open(info, 'w') as dst:
+        while True:
+            read = src.readinto(buffer)
+            if not read:
+                break
+            dst.write(buffer[:read])
+
+def _fast_move(src, dst):
+    """Moves a folder with a plain rename (instant on the same drive), copying only across drives.
+    The copy fallback is unavoidable there and uses shutil.copy2, which keeps file metadata. It is the
+    OS copy (CopyFile2) only on Python 3.12+; older versions copy through a buffer, like _fast_copy's fallback."""
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.move(src, dst, copy_function=shutil.copy2)
+        else:
+            raise
+
+def _extract_archive(archive_path, members, target_path):
+    """Extracts the given members (ZipInfo list from the archive) into target_path.
+    Folders and empty files are created first; file contents are then extracted in parallel,
+    each worker thread using its own ZipFile handle and a reusable 1 MiB copy buffer.
+    Names are sanitized like ZipFile.extractall() does; members that would still land outside
+    target_path are skipped. Returns the names of the skipped members."""
+    target_root = os.path.abspath(target_path)
+    file_entries = [] # (ZipInfo, destination) for members with content
+    skipped = []
+    for zi in members:
+        rel_path = _safe_member_path(zi.filename)
+        dest = os.path.abspath(os.path.join(target_root, rel_path))
+        try:
+            is_inside = bool(rel_path) and os.path.commonpath([target_root, dest]) == target_root
+        except ValueError: # Different drives on Windows
+            is_inside = False
+        if not is_inside:
+            skipped.append(zi.filename) # Unsafe path (e.g., "../"); never write outside the target folder
+            continue
+        if zi.is_dir():
+            os.makedirs(dest, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if zi.file_size == 0:
+            open(dest, 'wb').close()
+            continue
+        file_entries.append((zi, dest))
+
+    local = threading.local()
+    handles = [] # Every per-thread ZipFile, closed once extraction is done
+
+    def _extract_one(entry):
+        zi, dest = entry
+        zipf = getattr(local, "zipf", None)
+        if zipf is None: # ZipFile objects aren't safe to share between threads
+            zipf = local.zipf = zipfile.ZipFile(archive_path, 'r')
+            local.buffer = memoryview(bytearray(1024 * 1024))
+            handles.append(zipf)
+        buffer = local.buffer
+        # No os.fsync() per file: flushing each of thousands of files is very slow, and the OS writes
+        # them back on its own. A failed restore is covered by the pre-restore folder and rollback.
+        with zipf.open(zi) as src, open(dest, 'wb') as dst:
+            while True:
+                read = src.readinto(buffer)
+                if not read:
+                    break
+                dst.write(buffer[:read])
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            list(executor.map(_extract_one, file_entries))
+    finally:
+        for zipf in handles:
+            zipf.close()
+    return skipped
+
 def _perform_backup_restore(action_type, item_type, source_path, dialog_title, initial_filename_prefix, file_extension):
     """Generic helper for backup/restore operations."""
+    if file_job_running():
+        return
     sims4_user_path = get_sims4_user_data_path()
     if not sims4_user_path:
         messagebox.showerror("Error", "Could not determine Sims 4 user data directory.")
@@ -629,23 +1002,23 @@ def _perform_backup_restore(action_type, item_type, source_path, dialog_title, i
             return
 
         update_status(f"Backing up {item_type.lower()} to {os.path.basename(archive_path)}...")
-        root.update_idletasks()
-        try:
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root_dir, _, files in os.walk(target_path):
+
+        def _backup(post):
+            """Runs on a worker thread; UI calls are handed to the Tk thread via post()."""
+            try:
+                buffer = memoryview(bytearray(1024 * 1024)) # Reused for every file in the backup
+                with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED) as zipf:
                     # Skip the pre-restore backup folders if they exist inside target_path (unlikely but possible)
-                    if os.path.basename(root_dir).startswith(f"{source_path}_pre_restore_"):
-                        continue
-                    relative_path = os.path.relpath(root_dir, target_path)
-                    for file in files:
-                        full_path = os.path.join(root_dir, file)
-                        arcname = os.path.join(relative_path, file) if relative_path != '.' else file
-                        zipf.write(full_path, arcname=arcname)
-            update_status(f"{item_type} backup completed successfully.")
-            messagebox.showinfo("Backup Complete", f"{item_type} backed up to:\n{archive_path}")
-        except Exception as e:
-            update_status(f"{item_type} backup failed: {e}")
-            messagebox.showerror("Backup Failed", f"Could not create {item_type.lower()} backup.\nError: {e}")
+                    for count, (full_path, arcname) in enumerate(_iter_backup_files(target_path, f"{source_path}_pre_restore_"), 1):
+                        _write_to_zip(zipf, full_path, arcname, buffer)
+                        post(update_status, f"Backing up {item_type.lower()}... {count} files")
+                post(update_status, f"{item_type} backup completed successfully.")
+                post(messagebox.showinfo, "Backup Complete", f"{item_type} backed up to:\n{archive_path}")
+            except Exception as e:
+                post(update_status, f"{item_type} backup failed: {e}")
+                post(messagebox.showerror, "Backup Failed", f"Could not create {item_type.lower()} backup.\nError: {e}")
+
+        run_in_background(_backup, file_job=True)
 
     elif action_type == "restore":
         archive_path = filedialog.askopenfilename(
@@ -656,7 +1029,14 @@ def _perform_backup_restore(action_type, item_type, source_path, dialog_title, i
         if not archive_path:
             update_status(f"{item_type} restore cancelled.")
             return
-        if not os.path.isfile(archive_path) or not zipfile.is_zipfile(archive_path):
+        if not os.path.isfile(archive_path):
+            messagebox.showerror("Invalid File", f"Not a valid ZIP archive:\n{archive_path}")
+            return
+        # Read the member list once up front; this doubles as the validity check
+        try:
+            with zipfile.ZipFile(archive_path, 'r') as zipf:
+                members = zipf.infolist()
+        except (zipfile.BadZipFile, OSError):
             messagebox.showerror("Invalid File", f"Not a valid ZIP archive:\n{archive_path}")
             return
 
@@ -670,55 +1050,68 @@ def _perform_backup_restore(action_type, item_type, source_path, dialog_title, i
             update_status(f"{item_type} restore cancelled by confirmation.")
             return
 
-        pre_restore_backup_path = ""
-        if os.path.exists(target_path):
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # Place backup adjacent to target folder
-            pre_restore_backup_path = os.path.join(sims4_user_path, f"{source_path}_pre_restore_{timestamp}")
-            update_status(f"Moving current {item_type.lower()} to {os.path.basename(pre_restore_backup_path)}...")
-            root.update_idletasks()
+        def _restore(post):
+            """Runs on a worker thread; UI calls are handed to the Tk thread via post()."""
+            pre_restore_backup_path = ""
+            # One stat answers both "does it exist" and "is it a folder" for the whole restore
             try:
-                shutil.move(target_path, pre_restore_backup_path)
-                update_status(f"Current {item_type.lower()} moved successfully.")
-            except Exception as e:
-                update_status(f"Error moving current {item_type.lower()}: {e}")
-                messagebox.showerror("Restore Error", f"Could not move current {item_type} folder:\n{target_path}\nRestore aborted. Error: {e}")
-                return
-
-        try:
-            os.makedirs(target_path, exist_ok=True) # Ensure target dir exists
-            update_status(f"Extracting backup to {target_path}...")
-            root.update_idletasks()
-            with zipfile.ZipFile(archive_path, 'r') as zipf:
-                zipf.extractall(target_path)
-            update_status(f"{item_type} restore completed successfully.")
-            msg = f"{item_type} restored from:\n{os.path.basename(archive_path)}"
-            if pre_restore_backup_path:
-                msg += f"\n\nPrevious {item_type.lower()} backed up in:\n{pre_restore_backup_path}"
-            messagebox.showinfo("Restore Complete", msg)
-            # Refresh relevant list/info if needed
-            if item_type == "Saves":
-                update_save_info() # Update displayed save info
-            elif item_type == "Mods":
-                refresh_mods_list() # Update the mods listbox
+                target_exists = True
+                target_is_dir = stat.S_ISDIR(os.stat(target_path).st_mode)
+            except OSError:
+                target_exists = target_is_dir = False
+            if target_exists:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                # Place backup adjacent to target folder
+                pre_restore_backup_path = os.path.join(sims4_user_path, f"{source_path}_pre_restore_{timestamp}")
+                post(update_status, f"Moving current {item_type.lower()} to {os.path.basename(pre_restore_backup_path)}...")
+                try:
+                    _fast_move(target_path, pre_restore_backup_path)
+                    target_is_dir = False
+                    post(update_status, f"Current {item_type.lower()} moved successfully.")
+                except Exception as e:
+                    post(update_status, f"Error moving current {item_type.lower()}: {e}")
+                    post(messagebox.showerror, "Restore Error", f"Could not move current {item_type} folder:\n{target_path}\nRestore aborted. Error: {e}")
+                    return
 
-        except Exception as e:
-            update_status(f"Restore failed during extraction: {e}")
-            messagebox.showerror("Restore Failed", f"Could not extract {item_type.lower()} backup.\nError: {e}\nAttempting rollback...")
             try:
-                # Attempt rollback
-                if os.path.isdir(target_path): # Remove potentially partially extracted folder
-                    shutil.rmtree(target_path)
-                if pre_restore_backup_path and os.path.isdir(pre_restore_backup_path):
-                    shutil.move(pre_restore_backup_path, target_path)
-                    update_status(f"Rolled back: Previous {item_type.lower()} restored.")
-                    messagebox.showinfo("Rollback", f"Previous {item_type} folder restored.")
+                os.makedirs(target_path, exist_ok=True) # Ensure target dir exists
+                target_is_dir = True
+                post(update_status, f"Extracting backup to {target_path}...")
+                skipped_members = _extract_archive(archive_path, members, target_path)
+                msg = f"{item_type} restored from:\n{os.path.basename(archive_path)}"
+                if pre_restore_backup_path:
+                    msg += f"\n\nPrevious {item_type.lower()} backed up in:\n{pre_restore_backup_path}"
+                if skipped_members:
+                    post(update_status, f"{item_type} restore completed; {len(skipped_members)} unsafe item(s) skipped.")
+                    msg += "\n\nThe following items had unsafe paths and were SKIPPED:\n\n" + "\n".join(skipped_members)
                 else:
-                    update_status(f"Rollback failed: No pre-restore backup found or it was already moved: {pre_restore_backup_path}")
-                    messagebox.showwarning("Rollback Failed", f"Could not restore previous {item_type.lower()}. Check manually.")
-            except Exception as rollback_e:
-                update_status(f"CRITICAL: Rollback failed: {rollback_e}")
-                messagebox.showerror("Critical Rollback Error", f"Rollback failed after extraction error.\nError: {rollback_e}\nCheck your '{source_path}' and backup folders manually!")
+                    post(update_status, f"{item_type} restore completed successfully.")
+                post(messagebox.showinfo, "Restore Complete", msg)
+                # Refresh relevant list/info if needed
+                if item_type == "Saves":
+                    post(update_save_info) # Update displayed save info
+                elif item_type == "Mods":
+                    post(refresh_mods_list) # Update the mods listbox
+
+            except Exception as e:
+                post(update_status, f"Restore failed during extraction: {e}")
+                post(messagebox.showerror, "Restore Failed", f"Could not extract {item_type.lower()} backup.\nError: {e}\nAttempting rollback...")
+                try:
+                    # Attempt rollback
+                    if target_is_dir: # Remove potentially partially extracted folder
+                        shutil.rmtree(target_path)
+                    if pre_restore_backup_path: # Only set once the current folder was moved there
+                        _fast_move(pre_restore_backup_path, target_path)
+                        post(update_status, f"Rolled back: Previous {item_type.lower()} restored.")
+                        post(messagebox.showinfo, "Rollback", f"Previous {item_type} folder restored.")
+                    else:
+                        post(update_status, f"Rollback failed: No pre-restore backup found or it was already moved: {pre_restore_backup_path}")
+                        post(messagebox.showwarning, "Rollback Failed", f"Could not restore previous {item_type.lower()}. Check manually.")
+                except Exception as rollback_e:
+                    post(update_status, f"CRITICAL: Rollback failed: {rollback_e}")
+                    post(messagebox.showerror, "Critical Rollback Error", f"Rollback failed after extraction error.\nError: {rollback_e}\nCheck your '{source_path}' and backup folders manually!")
+
+        run_in_background(_restore, file_job=True)
 
 # --- Specific Backup/Restore Functions using the helper ---
 
@@ -736,11 +1129,14 @@ def restore_mods():
 
 # --- NEW: Update Save Info Function ---
 def update_save_info():
-    """Updates the labels on the Save Files tab with info about the saves folder."""
-    sims4_user_path = get_sims4_user_data_path()
-    saves_path = ""
-    if sims4_user_path:
-        saves_path = os.path.join(sims4_user_path, "saves")
+    """Updates the labels on the Save Files tab with info about the saves folder.
+    Only one scan runs at a time; a call made meanwhile re-runs it once the current scan is done,
+    so an older result never overwrites a newer one."""
+    global _save_info_running, _save_info_rerun
+    if _save_info_running:
+        _save_info_rerun = True
+        return
+    saves_path = get_saves_path()
 
     if not saves_path or not os.path.isdir(saves_path):
         save_path_var.set("Saves folder not found")
@@ -749,68 +1145,125 @@ def update_save_info():
         save_size_var.set("N/A")
         update_status("Could not find saves folder to get info.")
         # Disable buttons if path is invalid
-        backup_saves_button.config(state=tk.DISABLED)
-        restore_saves_button.config(state=tk.DISABLED)
+        set_file_buttons_state((backup_saves_button, restore_saves_button), False)
         return
 
-    # Path exists, enable buttons
-    backup_saves_button.config(state=tk.NORMAL)
-    restore_saves_button.config(state=tk.NORMAL)
+    # Path exists, enable buttons (unless a backup/restore/install is running)
+    set_file_buttons_state((backup_saves_button, restore_saves_button), True)
 
     save_path_var.set(saves_path)
     update_status("Gathering save file information...")
-    root.update_idletasks()
 
+    def _gather(post):
+        """Runs on a worker thread; the labels are updated on the Tk thread."""
+        try:
+            info = _collect_save_info(saves_path)
+        except Exception as e:
+            info = {"saves_path": saves_path, "error": e}
+        post(_apply_save_info, info)
+        post(_finish_save_info)
+
+    _save_info_running = True
+    refresh_save_info_button.config(state=tk.DISABLED)
+    run_in_background(_gather)
+
+def _finish_save_info():
+    """Called on the Tk thread after a save info scan; starts the re-run requested meanwhile, if any."""
+    global _save_info_running, _save_info_rerun
+    _save_info_running = False
+    if _save_info_rerun:
+        _save_info_rerun = False
+        update_save_info()
+    else:
+        refresh_save_info_button.config(state=tk.NORMAL)
+
+def _scan_save_dir(path):
+    """Scans one folder of the saves tree (not recursively) using scandir's cached entry info.
+    On Windows DirEntry.stat() is served from the directory listing itself, so no file is opened
+    or stat'ed separately. Returns (total_size, save_count, latest_mtime, subdir_entries);
+    a folder that can't be opened counts as empty, and files that can't be stat'ed are skipped."""
     total_size = 0
-    save_files = []
+    save_count = 0
     latest_mtime = 0
-
+    subdirs = []
     try:
-        for root_dir, dirs, files in os.walk(saves_path):
-            # Skip the pre-restore backup folders if they somehow ended up inside 'saves'
-            if os.path.basename(root_dir).startswith("saves_pre_restore_"):
-                dirs[:] = [] # Don't recurse into these
-                continue
-
-            for file in files:
-                full_path = os.path.join(root_dir, file)
-                try:
-                    stats = os.stat(full_path)
+        it = os.scandir(path)
+    except OSError:
+        return 0, 0, 0, [] # Unreadable folder (e.g., permission denied): count it as empty
+    with it:
+        try:
+            for entry in it:
+                if entry.is_symlink():
+                    continue # Don't count links (or follow them out of the saves folder)
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip the pre-restore backup folders if they somehow ended up inside 'saves'
+                    if not entry.name.startswith("saves_pre_restore_"):
+                        subdirs.append(entry)
+                elif entry.is_file(follow_symlinks=False):
+                    is_save = entry.name.endswith(_SAVE_SUFFIXES)
+                    try:
+                        stats = entry.stat(follow_symlinks=False) # One stat serves both the size and the mtime
+                    except OSError:
+                        continue # Ignore files we can't access or stat
                     total_size += stats.st_size
-                    if file.lower().endswith(".save"):
-                        save_files.append(full_path)
+                    if is_save:
+                        save_count += 1
                         if stats.st_mtime > latest_mtime:
                             latest_mtime = stats.st_mtime
-                except OSError:
-                    continue # Ignore files we can't access or stat
-
-        save_count_var.set(str(len(save_files)))
-
-        if latest_mtime > 0:
-            latest_dt = datetime.fromtimestamp(latest_mtime)
-            save_latest_var.set(latest_dt.strftime("%Y-%m-%d %H:%M:%S"))
-        else:
-            save_latest_var.set("No .save files found")
-
-        # Format size
-        if total_size < 1024:
-            size_str = f"{total_size} Bytes"
-        elif total_size < 1024 * 1024:
-            size_str = f"{total_size / 1024:.2f} KB"
-        elif total_size < 1024 * 1024 * 1024:
-            size_str = f"{total_size / (1024 * 1024):.2f} MB"
-        else:
-            size_str = f"{total_size / (1024 * 1024 * 1024):.2f} GB"
-        save_size_var.set(size_str)
-
-        update_status("Save file information updated.")
+        except OSError:
+            pass # Listing failed part-way; keep what was counted so far
+    return total_size, save_count, latest_mtime, subdirs
+
+def _collect_save_info(saves_path):
+    """Adds up size, .save count and latest .save time for the saves folder. No Tk calls (runs off the GUI thread).
+    Sub-folders are scanned concurrently so their directory reads overlap. Totals aren't cached between
+    scans: a folder's mtime only changes with its direct entries, so cached totals would miss edits deeper down."""
+    total_size = 0
+    save_count = 0
+    latest_mtime = 0
 
-    except Exception as e:
-        update_status(f"Error getting save info: {e}")
-        save_path_var.set(saves_path) # Path might still be valid
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pending = {executor.submit(_scan_save_dir, saves_path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_size, dir_count, dir_latest, subdirs = future.result()
+                total_size += dir_size
+                save_count += dir_count
+                latest_mtime = max(latest_mtime, dir_latest)
+                pending.update(executor.submit(_scan_save_dir, entry.path) for entry in subdirs)
+
+    return {"saves_path": saves_path, "save_count": save_count, "latest_mtime": latest_mtime, "total_size": total_size}
+
+def _format_size(total_size):
+    """Formats a byte count as Bytes/KB/MB/GB/TB, picking the unit from the number's bit length."""
+    unit = min(max(0, (total_size.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if unit == 0:
+        return f"{total_size} Bytes"
+    return f"{total_size / (1 << (10 * unit)):.2f} {_SIZE_UNITS[unit]}"
+
+def _apply_save_info(info):
+    """Shows the result of _collect_save_info() on the Save Files tab."""
+    if "error" in info:
+        update_status(f"Error getting save info: {info['error']}")
+        save_path_var.set(info["saves_path"]) # Path might still be valid
         save_count_var.set("Error")
         save_latest_var.set("Error")
         save_size_var.set("Error")
+        return
+
+    save_count_var.set(str(info["save_count"]))
+
+    latest_mtime = info["latest_mtime"]
+    if latest_mtime > 0:
+        latest_dt = datetime.fromtimestamp(latest_mtime)
+        save_latest_var.set(latest_dt.strftime("%Y-%m-%d %H:%M:%S"))
+    else:
+        save_latest_var.set("No .save files found")
+
+    save_size_var.set(_format_size(info["total_size"]))
+
+    update_status("Save file information updated.")
 
 
 # --- GUI Setup ---
@@ -824,13 +1277,14 @@ game_path_var = tk.StringVar()      # Stores the game installation path
 status_var = tk.StringVar()         # Status bar message
 current_dlc_list = []               # List of detected DLCs [{folder, original_name, status}, ...]
 current_mod_list = []               # List of detected mods [{type, name, original_name, status, path}, ...]
-dlc_mapping = {}                    # Mapping of DLC codes to names
 
 # Save Info Variables (NEW)
 save_path_var = tk.StringVar(value="N/A")
 save_count_var = tk.StringVar(value="N/A")
 save_latest_var = tk.StringVar(value="N/A")
 save_size_var = tk.StringVar(value="N/A")
+_save_info_running = False          # A save info scan is in progress
+_save_info_rerun = False            # update_save_info() was called again meanwhile
 
 # --- Check Admin Privileges ---
 is_admin = False
@@ -891,87 +1345,111 @@ ttk.Label(save_info_frame, text="Total Folder Size:").grid(row=3, column=0, stic
 ttk.Label(save_info_frame, textvariable=save_size_var, anchor='w').grid(row=3, column=1, sticky='ew', padx=5, pady=2)
 
 # --- Official DLC Tab ---
-dlc_frame = ttk.Frame(notebook)
+dlc_frame = ttk.Frame(notebook) # Contents are built by _build_dlc_tab() when first shown
 notebook.add(dlc_frame, text="Official DLC")
 
-# List Frame for DLC
-dlc_list_frame = ttk.Frame(dlc_frame, padding="10 0 10 5")
-dlc_list_frame.pack(fill=tk.BOTH, expand=True)
-
-dlc_list_scrollbar_y = ttk.Scrollbar(dlc_list_frame, orient=tk.VERTICAL)
-dlc_list_scrollbar_x = ttk.Scrollbar(dlc_list_frame, orient=tk.HORIZONTAL)
-dlc_listbox = tk.Listbox(
-    dlc_list_frame,
-    selectmode=tk.SINGLE,
-    yscrollcommand=dlc_list_scrollbar_y.set,
-    xscrollcommand=dlc_list_scrollbar_x.set,
-    font=("Courier New", 10), # Monospaced font for alignment
-    height=15,
-    width=70 # Give it a reasonable initial width
-)
-dlc_list_scrollbar_y.config(command=dlc_listbox.yview)
-dlc_list_scrollbar_x.config(command=dlc_listbox.xview)
-dlc_list_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-dlc_list_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
-dlc_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-dlc_listbox.bind('<<ListboxSelect>>', on_dlc_select) # Event binding
-
-# Button Frame for DLC
-dlc_button_frame = ttk.Frame(dlc_frame, padding="10 5 10 10")
-dlc_button_frame.pack(fill=tk.X)
-
-toggle_dlc_button = ttk.Button(dlc_button_frame, text="Toggle Selected DLC", command=toggle_selected_dlc, state=tk.DISABLED)
-toggle_dlc_button.pack(side=tk.LEFT, padx=(0, 5))
-refresh_dlc_button = ttk.Button(dlc_button_frame, text="Refresh DLC List", command=refresh_dlc_list)
-refresh_dlc_button.pack(side=tk.LEFT, padx=(0, 10))
+def _build_dlc_tab():
+    """Creates the DLC tab's widgets (called the first time the tab is shown)."""
+    global dlc_listbox, toggle_dlc_button
+
+    # List Frame for DLC
+    dlc_list_frame = ttk.Frame(dlc_frame, padding="10 0 10 5")
+    dlc_list_frame.pack(fill=tk.BOTH, expand=True)
+
+    dlc_list_scrollbar_y = ttk.Scrollbar(dlc_list_frame, orient=tk.VERTICAL)
+    dlc_list_scrollbar_x = ttk.Scrollbar(dlc_list_frame, orient=tk.HORIZONTAL)
+    dlc_listbox = tk.Listbox(
+        dlc_list_frame,
+        selectmode=tk.SINGLE,
+        yscrollcommand=dlc_list_scrollbar_y.set,
+        xscrollcommand=dlc_list_scrollbar_x.set,
+        font=("Courier New", 10), # Monospaced font for alignment
+        height=15,
+        width=70 # Give it a reasonable initial width
+    )
+    dlc_list_scrollbar_y.config(command=dlc_listbox.yview)
+    dlc_list_scrollbar_x.config(command=dlc_listbox.xview)
+    dlc_list_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+    dlc_list_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+    dlc_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    dlc_listbox.bind('<<ListboxSelect>>', on_dlc_select) # Event binding
+
+    # Button Frame for DLC
+    dlc_button_frame = ttk.Frame(dlc_frame, padding="10 5 10 10")
+    dlc_button_frame.pack(fill=tk.X)
+
+    toggle_dlc_button = ttk.Button(dlc_button_frame, text="Toggle Selected DLC", command=toggle_selected_dlc, state=tk.DISABLED)
+    toggle_dlc_button.pack(side=tk.LEFT, padx=(0, 5))
+    refresh_dlc_button = ttk.Button(dlc_button_frame, text="Refresh DLC List", command=refresh_dlc_list)
+    refresh_dlc_button.pack(side=tk.LEFT, padx=(0, 10))
 
 # --- Mods Tab ---
-mods_frame = ttk.Frame(notebook)
+mods_frame = ttk.Frame(notebook) # Contents are built by _build_mods_tab() when first shown
 notebook.add(mods_frame, text="Mods")
 
-# List Frame for Mods
-mods_list_frame = ttk.Frame(mods_frame, padding="10 0 10 5")
-mods_list_frame.pack(fill=tk.BOTH, expand=True)
-
-mods_list_scrollbar_y = ttk.Scrollbar(mods_list_frame, orient=tk.VERTICAL)
-mods_list_scrollbar_x = ttk.Scrollbar(mods_list_frame, orient=tk.HORIZONTAL)
-mods_listbox = tk.Listbox(
-    mods_list_frame,
-    selectmode=tk.SINGLE,
-    yscrollcommand=mods_list_scrollbar_y.set,
-    xscrollcommand=mods_list_scrollbar_x.set,
-    font=("Courier New", 10), # Monospaced font
-    height=15,
-    width=70
-)
-mods_list_scrollbar_y.config(command=mods_listbox.yview)
-mods_list_scrollbar_x.config(command=mods_listbox.xview)
-mods_list_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-mods_list_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
-mods_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-mods_listbox.bind('<<ListboxSelect>>', on_mod_select) # Event binding
-
-# Button Frame for Mods
-mods_button_frame = ttk.Frame(mods_frame, padding="10 5 10 10")
-mods_button_frame.pack(fill=tk.X)
-
-toggle_mod_button = ttk.Button(mods_button_frame, text="Toggle Selected Mod", command=toggle_selected_mod, state=tk.DISABLED)
-toggle_mod_button.pack(side=tk.LEFT, padx=(0, 5))
-refresh_mod_button = ttk.Button(mods_button_frame, text="Refresh Mod List", command=refresh_mods_list)
-refresh_mod_button.pack(side=tk.LEFT, padx=(0, 10))
-
-ttk.Separator(mods_button_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=2)
-
-# NEW Install Mod Button
-install_mod_button = ttk.Button(mods_button_frame, text="Install New Mod...", command=install_new_mod, state=tk.DISABLED)
-install_mod_button.pack(side=tk.LEFT, padx=(5, 5))
-
-ttk.Separator(mods_button_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=2)
-
-backup_mods_button = ttk.Button(mods_button_frame, text="Backup Mods", command=backup_mods, state=tk.DISABLED)
-backup_mods_button.pack(side=tk.LEFT, padx=(5, 5))
-restore_mods_button = ttk.Button(mods_button_frame, text="Restore Mods", command=restore_mods, state=tk.DISABLED)
-restore_mods_button.pack(side=tk.LEFT, padx=(0, 10))
+def _build_mods_tab():
+    """Creates the Mods tab's widgets (called the first time the tab is shown)."""
+    global mods_listbox, toggle_mod_button, install_mod_button, backup_mods_button, restore_mods_button
+
+    # List Frame for Mods
+    mods_list_frame = ttk.Frame(mods_frame, padding="10 0 10 5")
+    mods_list_frame.pack(fill=tk.BOTH, expand=True)
+
+    mods_list_scrollbar_y = ttk.Scrollbar(mods_list_frame, orient=tk.VERTICAL)
+    mods_list_scrollbar_x = ttk.Scrollbar(mods_list_frame, orient=tk.HORIZONTAL)
+    mods_listbox = tk.Listbox(
+        mods_list_frame,
+        selectmode=tk.SINGLE,
+        yscrollcommand=mods_list_scrollbar_y.set,
+        xscrollcommand=mods_list_scrollbar_x.set,
+        font=("Courier New", 10), # Monospaced font
+        height=15,
+        width=70
+    )
+    mods_list_scrollbar_y.config(command=mods_listbox.yview)
+    mods_list_scrollbar_x.config(command=mods_listbox.xview)
+    mods_list_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+    mods_list_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+    mods_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    mods_listbox.bind('<<ListboxSelect>>', on_mod_select) # Event binding
+
+    # Button Frame for Mods
+    mods_button_frame = ttk.Frame(mods_frame, padding="10 5 10 10")
+    mods_button_frame.pack(fill=tk.X)
+
+    toggle_mod_button = ttk.Button(mods_button_frame, text="Toggle Selected Mod", command=toggle_selected_mod, state=tk.DISABLED)
+    toggle_mod_button.pack(side=tk.LEFT, padx=(0, 5))
+    refresh_mod_button = ttk.Button(mods_button_frame, text="Refresh Mod List", command=refresh_mods_list)
+    refresh_mod_button.pack(side=tk.LEFT, padx=(0, 10))
+
+    ttk.Separator(mods_button_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=2)
+
+    # NEW Install Mod Button
+    install_mod_button = ttk.Button(mods_button_frame, text="Install New Mod...", command=install_new_mod, state=tk.DISABLED)
+    install_mod_button.pack(side=tk.LEFT, padx=(5, 5))
+
+    ttk.Separator(mods_button_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=2)
+
+    backup_mods_button = ttk.Button(mods_button_frame, text="Backup Mods", command=backup_mods, state=tk.DISABLED)
+    backup_mods_button.pack(side=tk.LEFT, padx=(5, 5))
+    restore_mods_button = ttk.Button(mods_button_frame, text="Restore Mods", command=restore_mods, state=tk.DISABLED)
+    restore_mods_button.pack(side=tk.LEFT, padx=(0, 10))
+
+_built_tabs = set() # Lazily built tabs that exist so far: "dlc", "mods"
+
+def _on_tab_shown(event):
+    """Builds and fills the DLC/Mods tab the first time it is selected."""
+    selected = notebook.select()
+    if selected == str(dlc_frame) and "dlc" not in _built_tabs:
+        _build_dlc_tab()
+        _built_tabs.add("dlc")
+        populate_dlc_listbox()
+    elif selected == str(mods_frame) and "mods" not in _built_tabs:
+        _build_mods_tab()
+        _built_tabs.add("mods")
+        populate_mods_listbox()
+
+notebook.bind('<<NotebookTabChanged>>', _on_tab_shown)
 
 # --- Status Bar ---
 status_frame = ttk.Frame(root, relief=tk.SUNKEN, padding="2 2 2 2")
@@ -983,16 +1461,9 @@ status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=3)
 
 def initialize_app():
     """Initializes the application by loading config and setting up the GUI."""
-    global dlc_mapping, config
+    global config
     update_status("Initializing...")
 
-    # Load DLC Mapping first
-    dlc_mapping = load_dlc_mapping()
-    if dlc_mapping is None:
-        # Error message shown in load_dlc_mapping
-        root.quit() # Quit if mapping failed to load
-        return
-
     # Load Config
     config = load_config()
     path = config.get("game_path")
@@ -1013,8 +1484,9 @@ def initialize_app():
             messagebox.showinfo("Path Needed", "Could not find The Sims 4 installation automatically.\nUse 'Browse...' to select the game folder (e.g., ...\\Steam\\steamapps\\common\\The Sims 4 or ...\\EA Games\\The Sims 4).\n\nThis tool primarily helps manage DLC and Mods. Save backups work independently of the game path.")
 
     # Populate Lists and Info
-    populate_dlc_listbox()
-    populate_mods_listbox()
+    # DLC/Mods lists are filled when their tab is first opened; refresh any already open
+    refresh_dlc_list()
+    refresh_mods_list()
     update_save_info() # NEW: Populate save info on start
 
     # Admin Warning
@@ -1026,8 +1498,20 @@ def initialize_app():
          update_status("Ready. (Running as Administrator)")
 
 
+def on_close():
+    """Closes the window, asking first if a backup/restore/install is still writing files."""
+    if _file_job[0] and not messagebox.askyesno(
+            "Operation in Progress",
+            "A backup, restore or install is still running.\n"
+            "Closing now stops it part-way: files may be left half-written and a failed restore won't be rolled back.\n\n"
+            "Quit anyway?"):
+        return
+    root.destroy()
+
+
 # --- Run the Application ---
 if __name__ == "__main__":
+    root.protocol("WM_DELETE_WINDOW", on_close)
     # Use 'after' to ensure the main window is created before initialization runs
     root.after(100, initialize_app)
     root.mainloop()
\ No newline at end of file